@@ -0,0 +1,55 @@
+"""Small on-disk JSON caches stored in the project directory."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from .vivado import PROJECT_DIR_DEFAULT
+
+# Cache directory name (project-local, next to .vproj-port)
+CACHE_DIR_NAME = ".vproj-cache"
+
+
+def get_cache_dir(proj_dir: Optional[Path] = None) -> Path:
+    """Get project-local cache directory path."""
+    pd = proj_dir or Path(PROJECT_DIR_DEFAULT)
+    return pd / CACHE_DIR_NAME
+
+
+def read_cache(name: str, proj_dir: Optional[Path] = None) -> Optional[dict[str, Any]]:
+    """Read a named cache entry. Returns None if missing or unreadable."""
+    path = get_cache_dir(proj_dir) / f"{name}.json"
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_cache(name: str, data: dict[str, Any], proj_dir: Optional[Path] = None) -> None:
+    """Atomically write a named cache entry. Failures are ignored."""
+    cache_dir = get_cache_dir(proj_dir)
+    path = cache_dir / f"{name}.json"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def clear_cache(name: str, proj_dir: Optional[Path] = None) -> None:
+    """Remove a named cache entry (e.g. after the project is modified)."""
+    try:
+        (get_cache_dir(proj_dir) / f"{name}.json").unlink(missing_ok=True)
+    except OSError:
+        pass
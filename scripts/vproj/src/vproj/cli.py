@@ -674,16 +674,23 @@ def clean(ctx):
 @click.option("--xsim", "use_xsim", is_flag=True, help="Use Vivado xsim (default).")
 @click.option("--iverilog", "use_iverilog", is_flag=True, help="Use Icarus Verilog.")
 @click.option("--verilator", "use_verilator", is_flag=True, help="Use Verilator.")
-@click.option("--fst", "use_fst", is_flag=True, help="Output FST instead of VCD.")
+@click.option("--fst/--vcd", "use_fst", default=None,
+              help="Waveform format (default: FST with Verilator, VCD otherwise).")
 @click.option("-o", "--output", type=click.Path(path_type=Path), help="Output waveform path.")
 @click.option("-t", "--timeout", "timeout", type=str, default=None,
               help="Max simulation time (e.g., '1ms', '10us'). Without this, runs until $finish.")
 @click.option("--open", "open_waveform", is_flag=True, help="Open waveform in gtkwave after simulation.")
+@click.option("--clean", is_flag=True, help="Rebuild the Verilator model from scratch.")
+@click.option("--threads", type=click.IntRange(min=1), default=None,
+              help="Simulate with N threads (Verilator only; pays off on large designs).")
 @click.option("-I", "--include", "include_dirs", multiple=True,
               type=click.Path(path_type=Path, exists=True),
               help="Add include directory (can specify multiple times).")
+@click.option("--no-cache", is_flag=True,
+              help="Re-query include dirs and top module instead of using the --batch cache.")
 @click.pass_context
-def sim(ctx, testbench, use_xsim, use_iverilog, use_verilator, use_fst, output, timeout, open_waveform, include_dirs):
+def sim(ctx, testbench, use_xsim, use_iverilog, use_verilator, use_fst, output, timeout, open_waveform, clean,
+        threads, include_dirs, no_cache):
     """Run simulation and generate waveform."""
     from .sim import sim_cmd
 
@@ -706,6 +713,9 @@ def sim(ctx, testbench, use_xsim, use_iverilog, use_verilator, use_fst, output,
             batch=ctx.obj["batch"],
             gui=ctx.obj["gui"],
             daemon=ctx.obj["daemon"],
+            clean=clean,
+            threads=threads,
+            no_cache=no_cache,
         )
     )
 
@@ -717,8 +727,14 @@ def sim(ctx, testbench, use_xsim, use_iverilog, use_verilator, use_fst, output,
 @click.option("-I", "--include", "include_dirs", multiple=True,
               type=click.Path(path_type=Path, exists=True),
               help="Add include directory (can specify multiple times).")
+@click.option("-j", "--jobs", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Lint source directories in parallel (Verilator, larger projects). "
+                   "Opt-in: diagnostics may differ from a single lint run, and the "
+                   "multiple-top-module check is skipped.")
+@click.option("--no-cache", is_flag=True,
+              help="Re-query include dirs and top module instead of using the --batch cache.")
 @click.pass_context
-def check(ctx, files, use_verilator, use_iverilog, include_dirs):
+def check(ctx, files, use_verilator, use_iverilog, include_dirs, jobs, no_cache):
     """Lint/syntax check with Verilator or Icarus Verilog."""
     from .sim import check_cmd
 
@@ -737,6 +753,8 @@ def check(ctx, files, use_verilator, use_iverilog, include_dirs):
             daemon=ctx.obj["daemon"],
             wall=True,
             no_color=ctx.obj.get("no_color", False),
+            jobs=jobs,
+            no_cache=no_cache,
         )
     )
 
@@ -69,10 +69,20 @@ class ServerInfo:
         self.proj_dir = proj_dir
 
 
+# Recently seen running servers, keyed by absolute project dir. A command
+# typically checks for the server (check_vivado_available) and then looks it
+# up again to run TCL; this saves the second PING round trip.
+_SERVER_INFO_TTL = 5.0
+_server_info_cache: dict[str, tuple[float, ServerInfo]] = {}
+
+
 def find_server(proj_dir: Optional[Path] = None) -> ServerInfo:
     """
     Find a running vproj server (daemon or GUI).
 
+    A running server found within the last few seconds is reused without
+    pinging it again; "not running" is never cached.
+
     Args:
         proj_dir: Project directory to check
 
@@ -80,6 +90,11 @@ def find_server(proj_dir: Optional[Path] = None) -> ServerInfo:
         ServerInfo with details about the server
     """
     pd = Path(proj_dir) if proj_dir else Path(PROJECT_DIR_DEFAULT)
+    key = os.path.abspath(pd)
+    cached = _server_info_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _SERVER_INFO_TTL:
+        return cached[1]
+
     port_file = _get_port_file(pd)
     lock_file = _find_lock_file(pd)
 
@@ -96,12 +111,14 @@ def find_server(proj_dir: Optional[Path] = None) -> ServerInfo:
     try:
         result = _send_tcl_to_port(port, "PING", timeout=2.0)
         if "PONG" in result:
-            return ServerInfo(
+            info = ServerInfo(
                 running=True,
                 port=port,
                 is_gui=lock_file is not None,
                 proj_dir=pd,
             )
+            _server_info_cache[key] = (time.monotonic(), info)
+            return info
     except Exception:
         # Server not responding, clean up stale port file
         try:
@@ -124,7 +141,9 @@ def daemon_status(proj_dir: Optional[Path] = None) -> Tuple[bool, Optional[int],
 
 
 def _cleanup_files(proj_dir: Optional[Path] = None):
-    """Remove daemon port file."""
+    """Remove daemon port file (and forget any cached server for it)."""
+    pd = Path(proj_dir) if proj_dir else Path(PROJECT_DIR_DEFAULT)
+    _server_info_cache.pop(os.path.abspath(pd), None)
     port_file = _get_port_file(proj_dir)
     try:
         port_file.unlink(missing_ok=True)
@@ -259,6 +278,7 @@ def stop_daemon(proj_dir: Optional[Path] = None, quiet: bool = False) -> bool:
         time.sleep(0.5)
     except Exception:
         pass
+    _drop_connection(info.port)
 
     _cleanup_files(pd)
     if not quiet:
@@ -269,6 +289,36 @@ def stop_daemon(proj_dir: Optional[Path] = None, quiet: bool = False) -> bool:
 from typing import Callable
 
 
+# Open connections to servers by port, reused for every command this process
+# sends (the server keeps a client connection open between commands)
+_connections: dict[int, socket.socket] = {}
+
+
+class _StaleConnection(Exception):
+    """The server closed a connection before answering anything."""
+
+
+def _get_connection(port: int, timeout: float) -> Tuple[socket.socket, bool]:
+    """Get a connection to the server on port. Returns (sock, reused)."""
+    sock = _connections.get(port)
+    if sock is not None:
+        sock.settimeout(timeout)
+        return sock, True
+    sock = socket.create_connection(("127.0.0.1", port), timeout=timeout)
+    _connections[port] = sock
+    return sock, False
+
+
+def _drop_connection(port: int) -> None:
+    """Close and forget the cached connection to port, if any."""
+    sock = _connections.pop(port, None)
+    if sock is not None:
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+
 def _send_tcl_to_port(
     port: int,
     tcl: str,
@@ -278,6 +328,9 @@ def _send_tcl_to_port(
     """
     Send TCL command to a specific port and return result.
 
+    Reuses this process's connection to the server when there is one. If that
+    connection turns out to be stale (closed before any reply), reconnects once.
+
     Args:
         port: TCP port to connect to
         tcl: TCL code to execute
@@ -290,58 +343,84 @@ def _send_tcl_to_port(
     Raises:
         Exception if connection fails or command fails
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(timeout)
+    while True:
+        sock, reused = _get_connection(port, timeout)
+        try:
+            status, result, complete = _exchange(sock, tcl, output_callback)
+        except _StaleConnection:
+            _drop_connection(port)
+            if not reused:
+                raise ConnectionError(f"Server on port {port} closed the connection")
+            # Server dropped our idle connection before seeing the command - retry
+            continue
+        except BaseException:
+            # Timeout, reset, interrupted mid-response... don't reuse it
+            _drop_connection(port)
+            raise
+
+        if not complete:
+            # Server closed the connection without END_RESPONSE
+            _drop_connection(port)
+        if status == "ERROR":
+            raise RuntimeError(result)
+        return result
 
-    try:
-        sock.connect(("127.0.0.1", port))
 
+def _exchange(
+    sock: socket.socket,
+    tcl: str,
+    output_callback: Optional[Callable[[str], None]],
+) -> Tuple[Optional[str], str, bool]:
+    """Send one command on sock and read its response.
+
+    Returns (status, result, complete); complete is False if the server closed
+    the connection before END_RESPONSE.
+    """
+    response_lines = []
+    buffer = b""
+    status = None
+
+    try:
         # Send command
         for line in tcl.split("\n"):
             sock.sendall((line + "\n").encode())
         sock.sendall(b"END_CMD\n")
-
-        # Read response
-        response_lines = []
-        buffer = b""
-        status = None
-
-        while True:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            buffer += chunk
-
-            while b"\n" in buffer:
-                line, buffer = buffer.split(b"\n", 1)
-                # Strip CR if server sends CRLF
-                line_str = line.decode("utf-8", errors="replace").rstrip("\r")
-
-                if line_str == "END_RESPONSE":
-                    if status == "ERROR":
-                        raise RuntimeError("\n".join(response_lines))
-                    return "\n".join(response_lines)
-                elif line_str == "OK":
-                    status = "OK"
-                elif line_str == "ERROR":
-                    status = "ERROR"
-                elif line_str.startswith("OUTPUT:"):
-                    # Streaming output line
-                    output_line = line_str[7:]  # Remove "OUTPUT:" prefix
-                    if output_callback:
-                        output_callback(output_line)
-                    else:
-                        response_lines.append(output_line)
+        chunk = sock.recv(4096)
+    except (ConnectionResetError, BrokenPipeError):
+        # Peer had already closed this connection
+        raise _StaleConnection()
+    if not chunk:
+        raise _StaleConnection()
+
+    # Read response
+    while chunk:
+        buffer += chunk
+
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            # Strip CR if server sends CRLF
+            line_str = line.decode("utf-8", errors="replace").rstrip("\r")
+
+            if line_str == "END_RESPONSE":
+                return status, "\n".join(response_lines), True
+            elif line_str == "OK":
+                status = "OK"
+            elif line_str == "ERROR":
+                status = "ERROR"
+            elif line_str.startswith("OUTPUT:"):
+                # Streaming output line
+                output_line = line_str[7:]  # Remove "OUTPUT:" prefix
+                if output_callback:
+                    output_callback(output_line)
                 else:
-                    response_lines.append(line_str)
+                    response_lines.append(output_line)
+            else:
+                response_lines.append(line_str)
 
-        # If we get here without END_RESPONSE, something went wrong
-        if status == "ERROR":
-            raise RuntimeError("\n".join(response_lines))
-        return "\n".join(response_lines)
+        chunk = sock.recv(4096)
 
-    finally:
-        sock.close()
+    # If we get here without END_RESPONSE, something went wrong
+    return status, "\n".join(response_lines), False
 
 
 def send_tcl(
@@ -8,6 +8,7 @@ from typing import Optional, Tuple
 
 import click
 
+from .cache import clear_cache, read_cache, write_cache
 from .constants import Fileset
 from .context import VprojContext
 from .vivado import (
@@ -19,6 +20,59 @@ from .vivado import (
 )
 
 
+# TCL fragments for project queries used by check/sim. Output lines are
+# tagged (FILE|, INCLUDE|, TOP|) so several queries can share one invocation.
+_COMPILE_ORDER_TCL = r"""
+update_compile_order -fileset sources_1
+foreach f [get_files -compile_order sources -used_in synthesis -of_objects [get_filesets sources_1]] {
+  set p [get_property NAME $f]
+  set t [get_property FILE_TYPE $f]
+  puts "FILE|sources_1|$p|$t"
+}
+"""
+
+_INCLUDE_DIRS_TCL = r"""
+set inc_dirs [get_property include_dirs [get_filesets sources_1]]
+foreach d $inc_dirs {
+    puts "INCLUDE|$d"
+}
+"""
+
+_TOP_MODULE_TCL = """
+puts "TOP|[get_property TOP [get_filesets sources_1]]"
+"""
+
+
+def _parse_file_lines(output: str) -> list[tuple[str, str, str]]:
+    """Parse FILE|fileset|path|type lines into tuples."""
+    files = []
+    for line in output.splitlines():
+        if line.startswith("FILE|"):
+            parts = line[5:].split("|", 2)
+            if len(parts) == 3:
+                files.append((parts[0], parts[1], parts[2]))
+    return files
+
+
+def _parse_include_lines(output: str) -> list[Path]:
+    """Parse INCLUDE|path lines into Paths."""
+    include_dirs = []
+    for line in output.splitlines():
+        if line.startswith("INCLUDE|"):
+            path_str = line[8:]  # Strip "INCLUDE|"
+            if path_str:
+                include_dirs.append(Path(path_str))
+    return include_dirs
+
+
+def _parse_top_line(output: str) -> Optional[str]:
+    """Parse the TOP|module line."""
+    for line in output.splitlines():
+        if line.startswith("TOP|"):
+            return line[4:].strip() or None
+    return None
+
+
 def list_cmd(
     proj_hint: Optional[Path],
     proj_dir: Optional[Path],
@@ -61,13 +115,7 @@ foreach fs [list sources_1 constrs_1 sim_1] {
         if code != 0:
             return []
 
-        files = []
-        for line in output.splitlines():
-            if line.startswith("FILE|"):
-                parts = line[5:].split("|", 2)
-                if len(parts) == 3:
-                    files.append((parts[0], parts[1], parts[2]))
-        return files
+        return _parse_file_lines(output)
     else:
         return run_vivado_tcl_auto(
             tcl, proj_dir=proj_dir, settings=settings, quiet=quiet,
@@ -90,18 +138,7 @@ def get_files_in_compile_order(
     Returns list of (fileset, path, type) tuples in compile order.
     """
     xpr = find_xpr(proj_hint, proj_dir)
-    tcl = (
-        make_smart_open(xpr)
-        + r"""
-update_compile_order -fileset sources_1
-foreach f [get_files -compile_order sources -used_in synthesis -of_objects [get_filesets sources_1]] {
-  set p [get_property NAME $f]
-  set t [get_property FILE_TYPE $f]
-  puts "FILE|sources_1|$p|$t"
-}
-"""
-        + make_smart_close()
-    )
+    tcl = make_smart_open(xpr) + _COMPILE_ORDER_TCL + make_smart_close()
 
     result = run_vivado_tcl_auto(
         tcl, proj_dir=proj_dir, settings=settings, quiet=True,
@@ -111,13 +148,7 @@ foreach f [get_files -compile_order sources -used_in synthesis -of_objects [get_
     if code != 0:
         return []
 
-    files = []
-    for line in output.splitlines():
-        if line.startswith("FILE|"):
-            parts = line[5:].split("|", 2)
-            if len(parts) == 3:
-                files.append((parts[0], parts[1], parts[2]))
-    return files
+    return _parse_file_lines(output)
 
 
 def add_files_cmd(
@@ -496,6 +527,7 @@ def include_add_cmd(
         tcl, proj_dir=proj_dir, settings=settings, quiet=quiet,
         batch=batch, gui=gui, daemon=daemon
     )
+    clear_cache("project", proj_dir)
     if code == 0 and not quiet:
         click.echo("Include directories added.")
     return code
@@ -530,6 +562,7 @@ def include_rm_cmd(
         tcl, proj_dir=proj_dir, settings=settings, quiet=quiet,
         batch=batch, gui=gui, daemon=daemon
     )
+    clear_cache("project", proj_dir)
     if code == 0 and not quiet:
         click.echo("Include directories removed.")
     return code
@@ -552,16 +585,7 @@ def get_include_dirs(
     Returns list of Path objects, empty list on error.
     """
     xpr = find_xpr(proj_hint, proj_dir)
-    tcl = (
-        make_smart_open(xpr)
-        + r"""
-set inc_dirs [get_property include_dirs [get_filesets sources_1]]
-foreach d $inc_dirs {
-    puts "INCLUDE|$d"
-}
-"""
-        + make_smart_close()
-    )
+    tcl = make_smart_open(xpr) + _INCLUDE_DIRS_TCL + make_smart_close()
 
     result = run_vivado_tcl_auto(
         tcl, proj_dir=proj_dir, settings=settings, quiet=True,
@@ -574,15 +598,7 @@ foreach d $inc_dirs {
     if code != 0:
         return []
 
-    # Parse output
-    include_dirs = []
-    for line in output.splitlines():
-        if line.startswith("INCLUDE|"):
-            path_str = line[8:]  # Strip "INCLUDE|"
-            if path_str:
-                include_dirs.append(Path(path_str))
-
-    return include_dirs
+    return _parse_include_lines(output)
 
 
 # --- Top module management ---
@@ -598,11 +614,78 @@ def get_top_module(
 ) -> Optional[str]:
     """Get top module name from project."""
     xpr = find_xpr(proj_hint, proj_dir)
-    tcl = (
-        make_smart_open(xpr)
-        + """
-puts "TOP|[get_property TOP [get_filesets sources_1]]"
+    tcl = make_smart_open(xpr) + _TOP_MODULE_TCL + make_smart_close()
+
+    result = run_vivado_tcl_auto(
+        tcl, proj_dir=proj_dir, settings=settings, quiet=True,
+        batch=batch, gui=gui, daemon=daemon, return_output=True
+    )
+
+    code, output = result
+    if code != 0:
+        return None
+
+    return _parse_top_line(output)
+
+
+def _catch_query(name: str, tcl: str) -> str:
+    """Wrap a query snippet so its failure doesn't abort the queries after it."""
+    return f"""
+if {{[catch {{{tcl}}} _vproj_err]}} {{
+  puts "QUERYERR|{name}|$_vproj_err"
+}}
 """
+
+
+def _query_failed(output: str, name: str) -> bool:
+    """Check whether a _catch_query() snippet reported an error."""
+    return f"QUERYERR|{name}|" in output
+
+
+def get_project_info(
+    proj_hint: Optional[Path],
+    proj_dir: Optional[Path],
+    settings: Optional[Path],
+    batch: bool = False,
+    gui: bool = False,
+    daemon: bool = False,
+    with_files: bool = True,
+    use_cache: bool = False,
+) -> tuple[list[tuple[str, str, str]], list[Path], Optional[str]]:
+    """Get compile-order files, include dirs and top module in one query.
+
+    Combines get_files_in_compile_order(), get_include_dirs() and
+    get_top_module() into a single Vivado invocation. Each query is caught
+    separately, so one failing leaves the others' results intact.
+
+    In batch mode the project is read from the .xpr on disk, so include dirs
+    and top module are cached keyed by its path, size and mtime. A live
+    GUI/daemon session may hold edits the .xpr doesn't show yet, so it is
+    always queried. The compile order depends on source contents and is
+    never cached.
+
+    Args:
+        with_files: If False, skip the compile-order file query.
+        use_cache: If True (batch mode, with_files False), reuse the cached
+                   include dirs and top module while the .xpr is unchanged.
+
+    Returns (files, include_dirs, top_module); empty values on error.
+    """
+    xpr = find_xpr(proj_hint, proj_dir)
+    st = xpr.stat()
+    key = [str(xpr), st.st_size, st.st_mtime_ns]
+
+    if use_cache and batch and not with_files:
+        cached = read_cache("project", proj_dir)
+        if cached and cached.get("key") == key:
+            return [], [Path(d) for d in cached.get("include_dirs", [])], cached.get("top")
+
+    tcl = make_smart_open(xpr)
+    if with_files:
+        tcl += _catch_query("FILES", _COMPILE_ORDER_TCL)
+    tcl += (
+        _catch_query("INCLUDE", _INCLUDE_DIRS_TCL)
+        + _catch_query("TOP", _TOP_MODULE_TCL)
         + make_smart_close()
     )
 
@@ -613,13 +696,18 @@ puts "TOP|[get_property TOP [get_filesets sources_1]]"
 
     code, output = result
     if code != 0:
-        return None
+        return [], [], None
 
-    for line in output.splitlines():
-        if line.startswith("TOP|"):
-            return line[4:].strip() or None
+    include_dirs = _parse_include_lines(output)
+    top = _parse_top_line(output)
+    if batch and not (_query_failed(output, "INCLUDE") or _query_failed(output, "TOP")):
+        write_cache("project", {
+            "key": key,
+            "include_dirs": [str(d) for d in include_dirs],
+            "top": top,
+        }, proj_dir)
 
-    return None
+    return _parse_file_lines(output), include_dirs, top
 
 
 def set_top_module(
@@ -646,10 +734,12 @@ puts "TOP set to: {module}"
     if not quiet:
         click.echo(f"==> Setting top module to: {module}")
 
-    return run_vivado_tcl_auto(
+    code = run_vivado_tcl_auto(
         tcl, proj_dir=proj_dir, settings=settings, quiet=quiet,
         batch=batch, gui=gui, daemon=daemon
     )
+    clear_cache("project", proj_dir)
+    return code
 
 
 def get_hierarchy(
@@ -820,6 +910,7 @@ __all__ = [
     "include_rm_cmd",
     "get_include_dirs",
     "get_top_module",
+    "get_project_info",
     "set_top_module",
     "get_hierarchy",
     "info_cmd",
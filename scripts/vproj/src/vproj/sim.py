@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple
 
 import click
 from rich.console import Console
 from rich.live import Live
 from rich.markup import escape
+from rich.text import Text
 
 from .progress import ProgressTable, StageStatus
+from .project import get_project_info
 from .vivado import (
     PROJECT_DIR_DEFAULT,
     find_xpr,
@@ -26,6 +32,10 @@ from .vivado import (
 )
 
 
+# Vivado FILE_TYPE values that are passed to the linters
+_HDL_TYPES = frozenset({"SystemVerilog", "Verilog", "Verilog Header", "VHDL"})
+
+
 @dataclass
 class LintMessage:
     """A parsed lint message."""
@@ -35,75 +45,117 @@ class LintMessage:
     message: str
 
 
-def _parse_verilator_output(stderr: str) -> tuple[list[LintMessage], list[str]]:
-    """Parse verilator output into structured messages.
+# Pattern: %Error: /path/file.sv:123:45: Message text
+# Pattern: %Warning-TYPE: /path/file.sv:123:45: Message text
+_DIAG_RE = re.compile(
+    r'^%(?:(?P<error>Error)(?:-[A-Z0-9_]+)?|Warning-[A-Z0-9_]+):[ \t]*'
+    r'(?P<file>[^:\n]+):(?P<line>\d+)(?::\d+)?:[ \t]*(?P<msg>.+)$',
+    re.MULTILINE,
+)
+
+
+def _parse_verilator_output(stderr: str) -> list[LintMessage]:
+    """Parse verilator output into structured error/warning messages.
 
-    Returns (messages, raw_lines) where messages are parsed error/warnings
-    and raw_lines is the full output for display.
+    Scans the whole buffer in one pass rather than splitting it into lines.
     """
-    messages: list[LintMessage] = []
-    raw_lines = stderr.splitlines()
-
-    # Pattern: %Error: /path/file.sv:123:45: Message text
-    # Pattern: %Warning-TYPE: /path/file.sv:123:45: Message text
-    error_pattern = re.compile(r'^%Error(?:-[A-Z0-9_]+)?:\s*([^:]+):(\d+)(?::\d+)?:\s*(.+)$')
-    warning_pattern = re.compile(r'^%Warning-[A-Z0-9_]+:\s*([^:]+):(\d+)(?::\d+)?:\s*(.+)$')
-
-    for line in raw_lines:
-        error_match = error_pattern.match(line)
-        if error_match:
-            messages.append(LintMessage(
-                level="error",
-                file=Path(error_match.group(1)).name,
-                line=int(error_match.group(2)),
-                message=error_match.group(3),
-            ))
-            continue
-
-        warning_match = warning_pattern.match(line)
-        if warning_match:
-            messages.append(LintMessage(
-                level="warning",
-                file=Path(warning_match.group(1)).name,
-                line=int(warning_match.group(2)),
-                message=warning_match.group(3),
-            ))
+    return [_lint_message(m) for m in _DIAG_RE.finditer(stderr)]
+
+
+def _lint_message(m: re.Match[str]) -> LintMessage:
+    """Build a LintMessage from a _DIAG_RE match."""
+    return LintMessage(
+        level="error" if m.group("error") else "warning",
+        file=Path(m.group("file")).name,
+        line=int(m.group("line")),
+        message=m.group("msg"),
+    )
+
 
-    return messages, raw_lines
+_SOURCE_LINE_RE = re.compile(r'^\s*\d*\s*\|')
+
+
+def _lint_line_style(line: str) -> str:
+    """Get the display style for a raw verilator output line."""
+    if line.startswith("%Error"):
+        return "bold red"
+    if line.startswith("%Warning"):
+        return "yellow"
+    if line.lstrip().startswith((":", "...", "^")):
+        # Note/context lines and pointer lines
+        return "dim"
+    if "|" in line and _SOURCE_LINE_RE.match(line):
+        # Source code lines (number | code)
+        return "dim"
+    return ""
 
 
 def _format_lint_output(stderr: str, use_color: bool) -> tuple[int, int]:
     """Format and print lint output. Returns (error_count, warning_count)."""
-    from rich.console import Console
-    from rich.markup import escape
+    # Clean runs only contain chatter - skip parsing and per-line styling
+    has_diagnostics = "%Error" in stderr or "%Warning" in stderr
+    messages = _parse_verilator_output(stderr) if has_diagnostics else []
+
+    if use_color:
+        console = Console(stderr=True)
+
+        # Print colorized output as a single styled block (no markup parsing)
+        if has_diagnostics:
+            console.print(Text("\n").join(
+                Text(line, style=_lint_line_style(line)) for line in stderr.splitlines()
+            ))
+        else:
+            console.print(Text(stderr.rstrip("\n")))
+    else:
+        # Plain output
+        click.echo(stderr, err=True)
 
-    messages, raw_lines = _parse_verilator_output(stderr)
+    return _print_lint_summary(messages, use_color)
 
+
+def _stream_lint_output(cmd: List[str], use_color: bool) -> int:
+    """Run verilator, printing its output as it arrives, then a summary.
+
+    Lines are styled and parsed one at a time, so memory stays bounded and
+    errors show up while the lint is still running. Returns the exit code.
+    """
+    console = Console(stderr=True) if use_color else None
+    messages: List[LintMessage] = []
+    saw_output = False
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            saw_output = True
+            if line.startswith("%"):
+                match = _DIAG_RE.match(line)
+                if match:
+                    messages.append(_lint_message(match))
+            if console:
+                console.print(Text(line, style=_lint_line_style(line)))
+            else:
+                click.echo(line, err=True)
+
+    if saw_output:
+        _print_lint_summary(messages, use_color)
+    return proc.returncode
+
+
+def _print_lint_summary(messages: List[LintMessage], use_color: bool) -> tuple[int, int]:
+    """Print the error/warning summary. Returns (error_count, warning_count)."""
     errors = [m for m in messages if m.level == "error"]
     warnings = [m for m in messages if m.level == "warning"]
 
     if use_color:
         console = Console(stderr=True)
 
-        # Print colorized output
-        for line in raw_lines:
-            escaped_line = escape(line)
-            if line.startswith("%Error"):
-                console.print(f"[bold red]{escaped_line}[/bold red]")
-            elif line.startswith("%Warning"):
-                console.print(f"[yellow]{escaped_line}[/yellow]")
-            elif line.strip().startswith(":") or line.strip().startswith("..."):
-                # Note/context lines
-                console.print(f"[dim]{escaped_line}[/dim]")
-            elif "|" in line and re.match(r'^\s*\d*\s*\|', line):
-                # Source code lines (number | code)
-                console.print(f"[dim]{escaped_line}[/dim]")
-            elif line.strip().startswith("^"):
-                # Pointer lines
-                console.print(f"[dim]{escaped_line}[/dim]")
-            else:
-                console.print(escaped_line)
-
         # Print summary
         console.print()
         if errors or warnings:
@@ -128,9 +180,6 @@ def _format_lint_output(stderr: str, use_color: bool) -> tuple[int, int]:
         else:
             console.print("[bold green]==> No errors or warnings[/bold green]")
     else:
-        # Plain output
-        click.echo(stderr, err=True)
-
         # Print plain summary
         click.echo()
         if errors or warnings:
@@ -158,12 +207,188 @@ def _format_lint_output(stderr: str, use_color: bool) -> tuple[int, int]:
     return len(errors), len(warnings)
 
 
+@cache
 def _find_tool(name: str) -> Optional[Path]:
-    """Find a tool in PATH."""
+    """Find a tool in PATH (looked up once per process)."""
     path = shutil.which(name)
     return Path(path) if path else None
 
 
+def _tool_exe(name: str) -> str:
+    """Absolute path of a tool for argv[0], or the bare name if not in PATH.
+
+    subprocess only takes its posix_spawn fast path (instead of fork+exec)
+    when the executable has a directory component, so resolve it up front.
+    """
+    path = _find_tool(name)
+    return str(path) if path else name
+
+
+# Suffixes of HDL sources picked up by the iverilog/verilator sim backends
+_HDL_SUFFIXES = (".sv", ".v")
+
+
+def _find_hdl_sources(root: Path, skip_dirs: frozenset[str] = frozenset()) -> List[Path]:
+    """Find all .sv/.v files under root in a single directory walk.
+
+    Hidden directories (.Xil, .git, the vproj cache) and any absolute paths
+    in skip_dirs are not descended into.
+    """
+    sources: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith(".") or os.path.abspath(entry.path) in skip_dirs:
+                        continue
+                    stack.append(entry.path)
+                elif entry.name.endswith(_HDL_SUFFIXES):
+                    sources.append(Path(entry.path))
+    return sources
+
+
+def _collect_sources(root: Path, proj_dir: Optional[Path]) -> List[Path]:
+    """Get HDL sources under root, skipping generated Vivado output."""
+    pd = proj_dir or Path(PROJECT_DIR_DEFAULT)
+    return _find_hdl_sources(root, frozenset({os.path.abspath(pd)}))
+
+
+# Object file being built by the C++ compiler in a verilator --binary run
+_CXX_OBJECT_RE = re.compile(r'\s-o\s+(\S+\.o)\b')
+
+
+# Output lines worth showing when a compile/sim step fails: Verilator's
+# %Error/%Warning and compiler/iverilog "error:" style diagnostics
+_DIAGNOSTIC_RE = re.compile(r'^%(Error|Warning)|\berror\b', re.IGNORECASE)
+
+
+def _run_streaming(
+    cmd: List[str],
+    on_line: Optional[Callable[[str], None]] = None,
+    max_lines: int = 5,
+    cwd: Optional[str] = None,
+    env: Optional[dict[str, str]] = None,
+) -> tuple[int, List[str]]:
+    """Run a command, streaming combined stdout/stderr line by line.
+
+    Returns (returncode, report lines) so callers can report failures without
+    buffering the whole output in memory. The report lines are the first
+    `max_lines` diagnostics (they hold the actual error), or the last
+    `max_lines` lines of output if nothing looked like a diagnostic.
+    """
+    diagnostics: List[str] = []
+    last_lines: deque[str] = deque(maxlen=max_lines)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=cwd,
+        env=env,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            if len(diagnostics) < max_lines and _DIAGNOSTIC_RE.search(line):
+                diagnostics.append(line)
+            last_lines.append(line)
+            if on_line:
+                on_line(line)
+    return proc.returncode, diagnostics or list(last_lines)
+
+
+def _run_quiet(cmd: List[str], cwd: Optional[str] = None, env: Optional[dict[str, str]] = None) -> int:
+    """Run a command discarding its output. Returns the exit code."""
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=cwd,
+        env=env,
+    ).returncode
+
+
+def _unique_dirs(dirs: List[Path]) -> List[Path]:
+    """Drop repeated include dirs, keeping first-seen order.
+
+    Compared by absolute path (no symlink resolution, so no stat calls).
+    """
+    seen: set[str] = set()
+    unique = []
+    for d in dirs:
+        key = os.path.abspath(d)
+        if key not in seen:
+            seen.add(key)
+            unique.append(d)
+    return unique
+
+
+# Only split a parallel lint run when there are at least this many files
+_PARALLEL_LINT_MIN_FILES = 8
+
+
+def _verilator_lint_chunks(base_cmd: List[str], file_args: List[str]) -> List[List[str]]:
+    """Split a verilator lint into one command per source directory.
+
+    Each chunk lints its own directory's files. All other files are still
+    passed, in compile order, as -v libraries so packages and cross-directory
+    instances resolve without those files becoming lint targets themselves.
+
+    Only used when --jobs > 1 is asked for. Library files are elaborated
+    differently from lint targets and the multiple-top check is disabled, so
+    diagnostics can differ from the default single-invocation lint.
+    """
+    groups: dict[str, set[str]] = {}
+    for f in file_args:
+        groups.setdefault(os.path.dirname(f), set()).add(f)
+
+    chunks = []
+    for members in groups.values():
+        # A chunk may hold several unrelated modules - that's expected here
+        cmd = [*base_cmd, "-Wno-MULTITOP"]
+        for f in file_args:
+            if f in members:
+                cmd.append(f)
+            else:
+                cmd.extend(["-v", f])
+        chunks.append(cmd)
+    return chunks
+
+
+def _run_lint_chunks(cmds: List[List[str]], jobs: int) -> subprocess.CompletedProcess:
+    """Run lint commands concurrently and merge them into one result.
+
+    Returns the first non-zero exit code (a chunk killed by a signal has a
+    negative one, so max() would miss it); diagnostics reported by more than one
+    chunk (e.g. from a shared package) are only kept once.
+    """
+    # The linters are separate processes, so threads are enough to overlap them
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(
+            lambda c: subprocess.run(c, capture_output=True, text=True), cmds
+        ))
+
+    seen: set[str] = set()
+    stderr_parts: List[str] = []
+    for r in results:
+        # Diagnostics start with '%'; continuation lines belong to the previous one
+        for block in re.split(r"(?m)^(?=%)", r.stderr):
+            if block and block not in seen:
+                seen.add(block)
+                stderr_parts.append(block)
+
+    return subprocess.CompletedProcess(
+        cmds[0],
+        returncode=next((r.returncode for r in results if r.returncode), 0),
+        stdout="".join(r.stdout for r in results),
+        stderr="".join(stderr_parts),
+    )
+
+
 def _get_project_sources(
     proj_hint: Optional[Path],
     proj_dir: Optional[Path],
@@ -190,6 +415,8 @@ def check_cmd(
     daemon: bool = False,
     wall: bool = False,
     no_color: bool = False,
+    jobs: int = 1,
+    no_cache: bool = False,
 ) -> int:
     """Fast syntax check without full build.
 
@@ -198,6 +425,8 @@ def check_cmd(
 
     Args:
         wall: Enable all warnings (-Wall for verilator)
+        jobs: Lint source directories in parallel (verilator only)
+        no_cache: Ignore the cached include dirs and top module (--batch only)
     """
     # Determine which tool to use
     if use_verilator:
@@ -217,14 +446,25 @@ def check_cmd(
                 "  Or: sudo apt install iverilog"
             )
 
+    # Query files, include dirs and top module from the project in one go
+    project_includes: List[Path] = []
+    top_module: Optional[str] = None
+
     # Get files to check
     if files:
         file_list = [Path(f) for f in files]
+        try:
+            _, project_includes, top_module = get_project_info(
+                proj_hint, proj_dir, settings,
+                batch=batch, gui=gui, daemon=daemon,
+                with_files=False, use_cache=not no_cache
+            )
+        except Exception:
+            # Project not available or error - continue without project info
+            pass
     else:
         # Get source files from project in compile order
-        from .project import get_files_in_compile_order
-
-        project_files = get_files_in_compile_order(
+        project_files, project_includes, top_module = get_project_info(
             proj_hint, proj_dir, settings,
             batch=batch, gui=gui, daemon=daemon
         )
@@ -233,45 +473,19 @@ def check_cmd(
             raise click.ClickException("Could not get project files. Specify files explicitly.")
 
         # Filter to only HDL source files (not XDC, not sim_1 testbenches)
-        hdl_types = {"SystemVerilog", "Verilog", "Verilog Header", "VHDL"}
         file_list = [
             Path(path) for fileset, path, ftype in project_files
-            if ftype in hdl_types and fileset == "sources_1"
+            if ftype in _HDL_TYPES and fileset == "sources_1"
         ]
 
     if not file_list:
         raise click.ClickException("No source files found to check.")
 
-    # Get include directories from project + CLI overrides
-    all_includes: List[Path] = []
-
-    # Try to get includes from project
-    try:
-        from .project import get_include_dirs
-        project_includes = get_include_dirs(
-            proj_hint, proj_dir, settings,
-            batch=batch, gui=gui, daemon=daemon
-        )
-        all_includes.extend(project_includes)
-    except Exception:
-        # Project not available or error - continue without project includes
-        pass
+    # Include directories from project + CLI overrides
+    all_includes = _unique_dirs([*project_includes, *include_dirs])
 
-    # Add CLI-specified includes
-    all_includes.extend(include_dirs)
-
-    # Get top module from project for verilator
-    top_module: Optional[str] = None
-    try:
-        from .project import get_top_module
-        top_module = get_top_module(
-            proj_hint, proj_dir, settings,
-            batch=batch, gui=gui, daemon=daemon
-        )
-    except Exception:
-        pass
-
-    file_args = [str(f.resolve()) for f in file_list]
+    # abspath is pure string manipulation; verilator doesn't need symlinks resolved
+    file_args = [os.path.abspath(f) for f in file_list]
 
     if not quiet:
         click.echo(f"==> Checking {len(file_list)} files with {tool}")
@@ -282,56 +496,62 @@ def check_cmd(
 
     # Build command with include paths
     # Note: verilator requires -Ipath format (no space), iverilog accepts both
+    chunks: List[List[str]] = []
     if tool == "verilator":
-        cmd = ["verilator", "--lint-only", "--timing", "-sv"]
+        base_cmd = [_tool_exe("verilator"), "--lint-only", "--timing", "-sv"]
         if wall:
-            cmd.append("-Wall")
+            base_cmd.append("-Wall")
         else:
             # Syntax check only - don't fail on warnings
-            cmd.append("-Wno-fatal")
+            base_cmd.append("-Wno-fatal")
+        base_cmd.extend(f"-I{inc}" for inc in all_includes)
+
+        cmd = list(base_cmd)
         # Pass top module to avoid "multiple top modules" error
         if top_module:
             cmd.extend(["--top-module", top_module])
-        for inc in all_includes:
-            cmd.append(f"-I{inc}")
         cmd.extend(file_args)
+
+        if jobs > 1 and len(file_args) >= _PARALLEL_LINT_MIN_FILES:
+            chunks = _verilator_lint_chunks(base_cmd, file_args)
     else:  # iverilog
-        cmd = ["iverilog", "-t", "null", "-g2012"]
+        cmd = [_tool_exe("iverilog"), "-t", "null", "-g2012"]
         if wall:
             cmd.append("-Wall")
         # iverilog uses -s for top module
         if top_module:
             cmd.extend(["-s", top_module])
-        for inc in all_includes:
-            cmd.append(f"-I{inc}")
+        cmd.extend(f"-I{inc}" for inc in all_includes)
         cmd.extend(file_args)
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-        if result.stdout and not quiet:
-            click.echo(result.stdout)
-
-        # Format and display lint output with colorization and summary
-        if result.stderr:
-            if tool == "verilator" and not quiet:
-                # Use colorized formatter for verilator output
+        if len(chunks) > 1:
+            result = _run_lint_chunks(chunks, jobs)
+            if quiet:
+                return result.returncode
+            # Parallel runs: show the merged output once all chunks are done
+            if result.stdout:
+                click.echo(result.stdout)
+            if result.stderr:
                 _format_lint_output(result.stderr, use_color=not no_color)
-            else:
-                # Plain output for iverilog or quiet mode
-                click.echo(result.stderr, err=True)
+            returncode = result.returncode
+        elif quiet:
+            # Caller only wants the exit code - don't capture any output
+            return _run_quiet(cmd)
+        elif tool == "verilator":
+            # Stream colorized output as it arrives, with a summary at the end
+            returncode = _stream_lint_output(cmd, use_color=not no_color)
+        else:
+            # Plain output for iverilog, passed straight through: inheriting
+            # our stdout/stderr streams it unchanged, each on its own stream
+            returncode = subprocess.run(cmd).returncode
 
-        if result.returncode == 0:
-            if not quiet:
-                click.echo("==> Check passed")
+        if returncode == 0:
+            click.echo("==> Check passed")
         else:
-            if not quiet:
-                click.echo("==> Check failed", err=True)
+            click.echo("==> Check failed", err=True)
 
-        return result.returncode
+        return returncode
 
     except FileNotFoundError:
         raise click.ClickException(f"{tool} not found in PATH")
@@ -342,7 +562,7 @@ def sim_cmd(
     use_xsim: bool,
     use_iverilog: bool,
     use_verilator: bool,
-    use_fst: bool,
+    use_fst: Optional[bool],
     output: Optional[Path],
     timeout: Optional[str],
     open_waveform: bool,
@@ -354,6 +574,9 @@ def sim_cmd(
     batch: bool = False,
     gui: bool = False,
     daemon: bool = False,
+    clean: bool = False,
+    threads: Optional[int] = None,
+    no_cache: bool = False,
 ) -> int:
     """Run simulation and generate waveform.
 
@@ -366,10 +589,6 @@ def sim_cmd(
     sim_dir = pd / "sim"
     sim_dir.mkdir(parents=True, exist_ok=True)
 
-    tb_name = testbench.stem
-    ext = ".fst" if use_fst else ".vcd"
-    out_file = output or (sim_dir / f"{tb_name}{ext}")
-
     # Determine backend
     if use_xsim:
         backend = "xsim"
@@ -381,23 +600,32 @@ def sim_cmd(
         # Default to xsim if we have Vivado, else iverilog
         backend = "xsim"
 
+    # Verilator writes FST much faster (and far smaller) than VCD
+    if use_fst is None:
+        use_fst = backend == "verilator"
+
+    tb_name = testbench.stem
+    ext = ".fst" if use_fst else ".vcd"
+    out_file = output or (sim_dir / f"{tb_name}{ext}")
+
     # Get include directories from project + CLI overrides
     all_includes: List[Path] = []
 
     # For non-xsim backends, get includes from project
     if backend != "xsim":
         try:
-            from .project import get_include_dirs
-            project_includes = get_include_dirs(
+            _, project_includes, _ = get_project_info(
                 proj_hint, proj_dir, settings,
-                batch=batch, gui=gui, daemon=daemon
+                batch=batch, gui=gui, daemon=daemon,
+                with_files=False, use_cache=not no_cache
             )
             all_includes.extend(project_includes)
         except Exception:
             pass
 
-    # Add CLI-specified includes
+    # Add CLI-specified includes (a dir given both ways is only passed once)
     all_includes.extend(include_dirs)
+    all_includes = _unique_dirs(all_includes)
 
     console = Console()
 
@@ -418,7 +646,10 @@ def sim_cmd(
     elif backend == "iverilog":
         result = _sim_iverilog(testbench, out_file, use_fst, all_includes, proj_dir, quiet, console)
     else:
-        result = _sim_verilator(testbench, out_file, all_includes, proj_dir, quiet, console)
+        result = _sim_verilator(
+            testbench, out_file, use_fst, all_includes, proj_dir, quiet, console,
+            clean=clean, threads=threads,
+        )
 
     # Open waveform viewer if requested and waveform file exists
     # Opens even after Ctrl+C since VCD is saved on interrupt
@@ -551,13 +782,14 @@ def _sim_iverilog(
     console = console or Console()
 
     # Gather source files
-    sources = []
-    for pattern in ["**/*.sv", "**/*.v"]:
-        sources.extend(Path(".").glob(pattern))
+    sources = _collect_sources(Path("."), proj_dir)
 
     if not sources:
         raise click.ClickException("No source files found")
 
+    # Simulation environment (testbench reads VCD_FILE for the dump path)
+    sim_env = os.environ | {"VCD_FILE": str(output.resolve())}
+
     # Create temp directory for build
     with tempfile.TemporaryDirectory() as tmpdir:
         sim_out = Path(tmpdir) / "sim.out"
@@ -565,32 +797,25 @@ def _sim_iverilog(
 
         # Compile with include paths
         compile_cmd = [
-            "iverilog",
+            _tool_exe("iverilog"),
             "-g2012",
             "-o", str(sim_out),
             "-s", tb_name,
         ]
-        for inc in include_dirs:
-            compile_cmd.append(f"-I{inc}")
-        compile_cmd.extend([str(f) for f in sources])
+        compile_cmd.extend(f"-I{inc}" for inc in include_dirs)
+        compile_cmd.extend(map(str, sources))
 
         if quiet:
             # Quiet mode - no progress display
-            result = subprocess.run(compile_cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                return result.returncode
+            returncode = _run_quiet(compile_cmd)
+            if returncode != 0:
+                return returncode
 
-            vvp_cmd = ["vvp", str(sim_out)]
+            vvp_cmd = [_tool_exe("vvp"), str(sim_out)]
             if use_fst:
                 vvp_cmd.append("-fst")
 
-            result = subprocess.run(
-                vvp_cmd,
-                capture_output=True,
-                text=True,
-                env={**subprocess.os.environ, "VCD_FILE": str(output.resolve())},
-            )
-            return result.returncode
+            return _run_quiet(vvp_cmd, env=sim_env)
 
         # Non-quiet mode - use progress display
         progress_table = ProgressTable(["Compile", "Simulate"])
@@ -603,18 +828,17 @@ def _sim_iverilog(
             ))
             live.update(progress_table.render())
 
-            result = subprocess.run(compile_cmd, capture_output=True, text=True)
+            returncode, report_lines = _run_streaming(compile_cmd)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 progress_table.update("Compile", StageStatus(
                     name="Compile", progress=0, status="Failed", errors=1
                 ))
                 progress_table.add_message("[red]==> Compilation failed[/red]")
-                if result.stderr:
-                    for line in result.stderr.strip().splitlines()[:5]:
-                        progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
+                for line in report_lines:
+                    progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
                 live.update(progress_table.render())
-                return result.returncode
+                return returncode
 
             progress_table.update("Compile", StageStatus(
                 name="Compile", progress=100, status="Complete"
@@ -629,27 +853,21 @@ def _sim_iverilog(
             ))
             live.update(progress_table.render())
 
-            vvp_cmd = ["vvp", str(sim_out)]
+            vvp_cmd = [_tool_exe("vvp"), str(sim_out)]
             if use_fst:
                 vvp_cmd.append("-fst")
 
-            result = subprocess.run(
-                vvp_cmd,
-                capture_output=True,
-                text=True,
-                env={**subprocess.os.environ, "VCD_FILE": str(output.resolve())},
-            )
+            returncode, report_lines = _run_streaming(vvp_cmd, env=sim_env)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 progress_table.update("Simulate", StageStatus(
                     name="Simulate", progress=0, status="Failed", errors=1
                 ))
                 progress_table.add_message("[red]==> Simulation failed[/red]")
-                if result.stderr:
-                    for line in result.stderr.strip().splitlines()[:5]:
-                        progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
+                for line in report_lines:
+                    progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
                 live.update(progress_table.render())
-                return result.returncode
+                return returncode
 
             progress_table.update("Simulate", StageStatus(
                 name="Simulate", progress=100, status="Complete"
@@ -661,134 +879,172 @@ def _sim_iverilog(
         return 0
 
 
+def _move_file(src: Path, dst: Path) -> None:
+    """Move a file, renaming in place when src and dst share a filesystem.
+
+    Across filesystems the data is copied with shutil.copyfile (which uses
+    the kernel's sendfile fast path on Linux) without also copying metadata.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+        os.unlink(src)
+
+
 def _sim_verilator(
     testbench: Path,
     output: Path,
+    use_fst: bool,
     include_dirs: List[Path],
     proj_dir: Optional[Path],
     quiet: bool,
     console: Optional[Console] = None,
+    clean: bool = False,
+    threads: Optional[int] = None,
 ) -> int:
-    """Run simulation with Verilator."""
+    """Run simulation with Verilator.
+
+    The model is built in a persistent <proj_dir>/sim/verilator_<tb> dir so
+    repeat runs only recompile what changed; clean=True rebuilds from scratch.
+    threads > 1 builds a multi-threaded model (only worth it for big designs,
+    small ones lose more to synchronization than they gain).
+    """
     if not _find_tool("verilator"):
         raise click.ClickException("verilator not found. Install with: sudo apt install verilator")
 
     console = console or Console()
 
     # Gather source files
-    sources = []
-    for pattern in ["**/*.sv", "**/*.v"]:
-        sources.extend(Path(".").glob(pattern))
+    sources = _collect_sources(Path("."), proj_dir)
 
     if not sources:
         raise click.ClickException("No source files found")
 
     tb_name = testbench.stem
+    trace_name = "trace.fst" if use_fst else "trace.vcd"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Compile with verilator and include paths
-        compile_cmd = [
-            "verilator",
-            "--binary",
-            "--trace",
-            "-j", "0",
-            "-Wall",
-            "-Wno-fatal",
-            "--timing",
-            "--top", tb_name,
-            "-Mdir", tmpdir,
-        ]
-        for inc in include_dirs:
-            compile_cmd.append(f"-I{inc}")
-        compile_cmd.extend([str(f) for f in sources])
-
-        if quiet:
-            # Quiet mode - no progress display
-            result = subprocess.run(compile_cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                return result.returncode
-
-            exe = Path(tmpdir) / f"V{tb_name}"
-            if not exe.exists():
-                return 1
-
-            result = subprocess.run([str(exe)], capture_output=True, text=True, cwd=tmpdir)
-
-            trace = Path(tmpdir) / "trace.vcd"
-            if trace.exists():
-                shutil.move(str(trace), str(output))
-
-            return result.returncode
-
-        # Non-quiet mode - use progress display
-        progress_table = ProgressTable(["Compile", "Simulate"])
-        progress_table.set_active("Compile")
-
-        with Live(progress_table.render(), console=console, refresh_per_second=2) as live:
-            # Compile stage
-            progress_table.update("Compile", StageStatus(
-                name="Compile", progress=50, status="Compiling..."
-            ))
-            live.update(progress_table.render())
-
-            result = subprocess.run(compile_cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
+    pd = proj_dir or Path(PROJECT_DIR_DEFAULT)
+    # Absolute, since the model is run with cwd set to this dir
+    obj_dir = (pd / "sim" / f"verilator_{tb_name}").resolve()
+    if clean and obj_dir.exists():
+        shutil.rmtree(obj_dir)
+    obj_dir.mkdir(parents=True, exist_ok=True)
+    # Don't pick up a trace left behind by an interrupted run
+    (obj_dir / trace_name).unlink(missing_ok=True)
+
+    # Compile with verilator and include paths
+    compile_cmd = [
+        _tool_exe("verilator"),
+        "--binary",
+        "--trace-fst" if use_fst else "--trace",
+        "-j", "0",
+        "-Wall",
+        "-Wno-fatal",
+        "--timing",
+        "--top", tb_name,
+        "-Mdir", str(obj_dir),
+    ]
+    if threads and threads > 1:
+        compile_cmd.extend(["--threads", str(threads)])
+    compile_cmd.extend(f"-I{inc}" for inc in include_dirs)
+    compile_cmd.extend(map(str, sources))
+
+    if quiet:
+        # Quiet mode - no progress display
+        returncode = _run_quiet(compile_cmd)
+        if returncode != 0:
+            return returncode
+
+        exe = obj_dir / f"V{tb_name}"
+        if not exe.exists():
+            return 1
+
+        returncode = _run_quiet([str(exe)], cwd=str(obj_dir))
+
+        trace = obj_dir / trace_name
+        if trace.exists():
+            _move_file(trace, output)
+
+        return returncode
+
+    # Non-quiet mode - use progress display
+    progress_table = ProgressTable(["Compile", "Simulate"])
+    progress_table.set_active("Compile")
+
+    with Live(progress_table.render(), console=console, refresh_per_second=2) as live:
+        # Compile stage
+        progress_table.update("Compile", StageStatus(
+            name="Compile", progress=50, status="Compiling..."
+        ))
+        live.update(progress_table.render())
+
+        def show_compile_progress(line: str) -> None:
+            # Show which object the C++ compiler is currently building
+            match = _CXX_OBJECT_RE.search(line)
+            if match:
                 progress_table.update("Compile", StageStatus(
-                    name="Compile", progress=0, status="Failed", errors=1
+                    name="Compile", progress=50,
+                    status=f"Compiling {escape(Path(match.group(1)).name)}...",
                 ))
-                progress_table.add_message("[red]==> Compilation failed[/red]")
-                if result.stderr:
-                    for line in result.stderr.strip().splitlines()[:5]:
-                        progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
                 live.update(progress_table.render())
-                return result.returncode
 
+        returncode, report_lines = _run_streaming(compile_cmd, show_compile_progress)
+
+        if returncode != 0:
             progress_table.update("Compile", StageStatus(
-                name="Compile", progress=100, status="Complete"
+                name="Compile", progress=0, status="Failed", errors=1
             ))
-            progress_table.add_message("[green]==> Compilation complete[/green]")
+            progress_table.add_message("[red]==> Compilation failed[/red]")
+            for line in report_lines:
+                progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
             live.update(progress_table.render())
-
-            # Simulate stage
-            exe = Path(tmpdir) / f"V{tb_name}"
-            if not exe.exists():
-                progress_table.add_message(f"[red]==> Verilator executable not found: {escape(str(exe))}[/red]")
-                live.update(progress_table.render())
-                return 1
-
-            progress_table.set_active("Simulate")
-            progress_table.update("Simulate", StageStatus(
-                name="Simulate", progress=50, status="Running..."
-            ))
+            return returncode
+
+        progress_table.update("Compile", StageStatus(
+            name="Compile", progress=100, status="Complete"
+        ))
+        progress_table.add_message("[green]==> Compilation complete[/green]")
+        live.update(progress_table.render())
+
+        # Simulate stage
+        exe = obj_dir / f"V{tb_name}"
+        if not exe.exists():
+            progress_table.add_message(f"[red]==> Verilator executable not found: {escape(str(exe))}[/red]")
             live.update(progress_table.render())
+            return 1
 
-            result = subprocess.run([str(exe)], capture_output=True, text=True, cwd=tmpdir)
+        progress_table.set_active("Simulate")
+        progress_table.update("Simulate", StageStatus(
+            name="Simulate", progress=50, status="Running..."
+        ))
+        live.update(progress_table.render())
 
-            if result.returncode != 0:
-                progress_table.update("Simulate", StageStatus(
-                    name="Simulate", progress=0, status="Failed", errors=1
-                ))
-                progress_table.add_message("[red]==> Simulation failed[/red]")
-                if result.stderr:
-                    for line in result.stderr.strip().splitlines()[:5]:
-                        progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
-                live.update(progress_table.render())
-                return result.returncode
-
-            # Move trace file
-            trace = Path(tmpdir) / "trace.vcd"
-            if trace.exists():
-                shutil.move(str(trace), str(output))
+        returncode, report_lines = _run_streaming([str(exe)], cwd=str(obj_dir))
 
+        if returncode != 0:
             progress_table.update("Simulate", StageStatus(
-                name="Simulate", progress=100, status="Complete"
+                name="Simulate", progress=0, status="Failed", errors=1
             ))
-            progress_table.add_message("[green]==> Simulation complete[/green]")
-            progress_table.add_message(f"    Waveform: {escape(str(output))}")
+            progress_table.add_message("[red]==> Simulation failed[/red]")
+            for line in report_lines:
+                progress_table.add_message(f"    [dim]{escape(line)}[/dim]")
             live.update(progress_table.render())
+            return returncode
 
-        return 0
+        # Move trace file
+        trace = obj_dir / trace_name
+        if trace.exists():
+            _move_file(trace, output)
+
+        progress_table.update("Simulate", StageStatus(
+            name="Simulate", progress=100, status="Complete"
+        ))
+        progress_table.add_message("[green]==> Simulation complete[/green]")
+        progress_table.add_message(f"    Waveform: {escape(str(output))}")
+        live.update(progress_table.render())
+
+    return 0
 
 
 __all__ = ["sim_cmd", "check_cmd"]
@@ -6,23 +6,30 @@ import re
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 import click
 
 from .vivado import PROJECT_DIR_DEFAULT, run_vivado_tcl_auto, tcl_quote
 from .utils import display_path
 
+# Line patterns for rewrite_project_tcl() (matched one line at a time)
+# Match: <spaces>create_project <NAME> <DIR> <rest...>
+_CREATE_PROJ_RE = re.compile(
+    r'^(?P<prefix>\s*create_project\s+\S+)\s+(?P<dir>\S+)(?P<rest>.*)$'
+)
+_CREATE_PROJ_LINE_RE = re.compile(r'^\s*create_project\b')
+_ORIG_PROJ_DIR_RE = re.compile(r'^set\s+orig_proj_dir\s')
+_ORIGIN_DIR_RE = re.compile(r'^set\s+origin_dir\s')
+_BOARD_PART_RE = re.compile(r'set_property\s+-name\s+"board_part"\s+-value\s+"([^"]+)"')
+
 
 def extract_board_part(tcl_content: str) -> Optional[str]:
     """Extract board_part from TCL content.
 
     Returns the full board part identifier, e.g. 'digilentinc.com:nexys-a7-100t:part0:1.3'
     """
-    match = re.search(
-        r'set_property\s+-name\s+"board_part"\s+-value\s+"([^"]+)"',
-        tcl_content,
-    )
+    match = _BOARD_PART_RE.search(tcl_content)
     return match.group(1) if match else None
 
 
@@ -77,6 +84,50 @@ if {{[llength [get_board_parts -quiet $_board_part]] == 0}} {{
 '''
 
 
+def rewrite_project_tcl(
+    lines: Iterable[str], proj_dir_path: Path, force: bool
+) -> Tuple[str, Optional[str]]:
+    """Patch an exported project TCL for import, in a single pass over its lines.
+
+    - Re-points the <DIR> argument of the first 'create_project' to proj_dir_path
+    - Makes 'set orig_proj_dir' / 'set origin_dir' portable (relative to pwd)
+    - Injects -force into the first 'create_project' if requested
+
+    Takes the lines lazily (e.g. an open file), so only the patched copy is
+    ever held in memory. Returns (patched_tcl, board_part); board_part is
+    picked up on the way with extract_board_part().
+    """
+    out = []
+    dir_done = False
+    force_done = not force
+    board_part: Optional[str] = None
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+        eol = raw[len(line):]
+        if board_part is None and "board_part" in line:
+            board_part = extract_board_part(line)
+        if line.startswith("set"):
+            if _ORIG_PROJ_DIR_RE.match(line):
+                line = 'set orig_proj_dir "[file normalize [pwd]/]"'
+            elif _ORIGIN_DIR_RE.match(line):
+                line = 'set origin_dir [file normalize [pwd]]'
+        elif (not dir_done or not force_done) and line.lstrip().startswith("create_project"):
+            # Keep NAME & rest, replace only <DIR>.
+            if not dir_done:
+                m = _CREATE_PROJ_RE.match(line)
+                if m:
+                    line = f'{m.group("prefix")} ' + "{" + str(proj_dir_path) + "}" + m.group("rest")
+                    dir_done = True
+            if not force_done and _CREATE_PROJ_LINE_RE.match(line):
+                if "-force" not in line:
+                    line = line.replace("create_project", "create_project -force", 1)
+                force_done = True
+        out.append(line + eol)
+
+    return "".join(out), board_part
+
+
 def import_tcl_cmd(
     project_tcl: Path,
     workdir: Optional[Path],
@@ -98,46 +149,8 @@ def import_tcl_cmd(
         shutil.rmtree(proj_dir_path, ignore_errors=True)
         proj_dir_path.mkdir(parents=True, exist_ok=True)
 
-    src = Path(project_tcl).read_text()
-
-    # Re-point the project directory argument in 'create_project'
-    # Match: <spaces>create_project <NAME> <DIR> <rest...>
-    # Keep NAME & rest, replace only <DIR>.
-    create_proj_re = re.compile(
-        r'(?m)^(?P<prefix>\s*create_project\s+\S+)\s+(?P<dir>\S+)(?P<rest>.*)$'
-    )
-
-    def _replace_proj_dir(m):
-        return f'{m.group("prefix")} ' + "{" + str(proj_dir_path) + "}" + m.group("rest")
-
-    src, _ = create_proj_re.subn(_replace_proj_dir, src, count=1)
-
-    # Make original-project root portable
-    src = re.sub(
-        r'(?m)^set\s+orig_proj_dir\s+.*$',
-        'set orig_proj_dir "[file normalize [pwd]/]"',
-        src,
-    )
-
-    # Some Vivado scripts also have set origin_dir; normalize it too
-    src = re.sub(
-        r'(?m)^set\s+origin_dir\s+.*$',
-        'set origin_dir [file normalize [pwd]]',
-        src,
-    )
-
-    # Inject -force if requested
-    if force:
-
-        def add_force(m):
-            line = m.group(0)
-            return (
-                line
-                if "-force" in line
-                else line.replace("create_project", "create_project -force", 1)
-            )
-
-        src = re.sub(r'(?m)^\s*create_project\b[^\n]*', add_force, src, count=1)
+    with open(project_tcl) as f:
+        src, board_part = rewrite_project_tcl(f, proj_dir_path, force)
 
     with tempfile.NamedTemporaryFile("w", suffix=".tcl", delete=False) as tf:
         tf.write(src)
@@ -148,11 +161,9 @@ def import_tcl_cmd(
         pre = f"cd {tcl_quote(Path(workdir).resolve())}\n"
 
     # Auto-install board files if requested and board_part is specified
-    if install_board:
-        board_part = extract_board_part(src)
-        if board_part:
-            board_name = get_board_name(board_part)
-            pre += make_board_install_tcl(board_part, board_name)
+    if install_board and board_part:
+        board_name = get_board_name(board_part)
+        pre += make_board_install_tcl(board_part, board_name)
 
     tcl = pre + f"source {tcl_quote(patched)}\n"
 
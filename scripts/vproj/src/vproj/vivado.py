@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shlex
 import shutil
 import signal
 import subprocess
 import tempfile
+import threading
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Optional, Union
 
 import click
 from rich.console import Console
@@ -18,6 +22,11 @@ from rich.text import Text
 
 from .constants import FileKind, Fileset
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 PROJECT_DIR_DEFAULT = "project_files"
 
 # File extension to kind mapping
@@ -50,6 +59,10 @@ KIND_FILESET: dict[FileKind, Fileset] = {
 
 VALID_KINDS = tuple(sorted(set(KIND_FILESET.keys())))
 
+# detect_kind() heuristic inputs
+_HDL_EXTS = frozenset({".v", ".sv", ".vhd", ".vhdl"})
+_SIM_DIR_NAMES = frozenset({"sim", "tb", "testbench"})
+
 
 def detect_kind(path: Path) -> FileKind:
     """Detect file kind from extension and path."""
@@ -58,16 +71,31 @@ def detect_kind(path: Path) -> FileKind:
     if k:
         return k
     # Heuristic: HDL under /sim/ or /tb/ folders -> sim fileset
-    if ext in {".v", ".sv", ".vhd", ".vhdl"} and any(
-        p in {"sim", "tb", "testbench"} for p in path.parts
-    ):
+    if ext in _HDL_EXTS and not _SIM_DIR_NAMES.isdisjoint(path.parts):
         return FileKind.SIM
     return FileKind.OTHER
 
 
+# Characters that are special to TCL outside of braces
+_TCL_SPECIAL_RE = re.compile(r'([\s\\{}\[\]$";])')
+
+
 def tcl_quote(p: Path) -> str:
-    """Quote a path for TCL."""
-    return "{" + str(p) + "}"
+    """Quote a path for TCL.
+
+    Paths are brace-quoted; the rare path containing braces or backslashes
+    (which brace quoting can't represent safely) is backslash-escaped instead.
+    """
+    s = os.fspath(p)
+    if "{" in s or "}" in s or "\\" in s:
+        return _TCL_SPECIAL_RE.sub(r"\\\1", s)
+    return "{" + s + "}"
+
+
+@cache
+def _which_vivado() -> Optional[str]:
+    """Find vivado in PATH (looked up once per process)."""
+    return shutil.which("vivado")
 
 
 def check_vivado_available(
@@ -91,7 +119,7 @@ def check_vivado_available(
         if info.running:
             return
 
-    if shutil.which("vivado") is None:
+    if _which_vivado() is None:
         raise click.ClickException(
             "Vivado not found in PATH. Either:\n"
             "  1. Source Vivado settings first: source ~/xilinx/2025.1/Vivado/settings64.sh\n"
@@ -99,6 +127,20 @@ def check_vivado_available(
         )
 
 
+# Marker line printed by the xsim progress loop: SIM_PROGRESS:<time>
+_SIM_PROGRESS_PREFIX = "SIM_PROGRESS:"
+
+
+def _sim_progress_time(line: str) -> Optional[str]:
+    """Return the sim time from a SIM_PROGRESS: marker line, else None.
+
+    A plain prefix check, so ordinary output lines never touch the regex engine.
+    """
+    if line.startswith(_SIM_PROGRESS_PREFIX) and len(line) > len(_SIM_PROGRESS_PREFIX):
+        return line[len(_SIM_PROGRESS_PREFIX):].strip()
+    return None
+
+
 def _make_sim_progress_display(sim_time: str) -> Text:
     """Create a simulation progress display."""
     text = Text()
@@ -107,6 +149,110 @@ def _make_sim_progress_display(sim_time: str) -> Text:
     return text
 
 
+# Size for the Vivado output pipe (kernel buffer and Python read buffer).
+# Big synth/impl logs then take far fewer wakeups, and Vivado rarely blocks on us.
+_PIPE_SIZE = 1 << 20
+
+
+def _grow_pipe(pipe: IO[str]) -> None:
+    """Enlarge a pipe's kernel buffer where supported (best effort)."""
+    setpipe_sz = getattr(fcntl, "F_SETPIPE_SZ", None)  # fcntl is None off POSIX
+    if setpipe_sz is None:
+        # Not Linux (or Python < 3.10) - keep the default
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), setpipe_sz, _PIPE_SIZE)
+    except OSError:
+        # Above /proc/sys/fs/pipe-max-size - keep the default
+        pass
+
+
+# Streamed tool output is written to the terminal in batches of up to this
+# many characters, or after this many seconds, whichever comes first
+_ECHO_BATCH_SIZE = 1 << 16
+_ECHO_BATCH_DELAY = 0.1
+
+
+class _BatchedEcho:
+    """Coalesce streamed output lines into fewer, larger terminal writes.
+
+    click.echo flushes on every call; a verbose build does that tens of
+    thousands of times. Text is held until a batch fills up, and a background
+    thread writes whatever is pending every _ECHO_BATCH_DELAY seconds so a
+    quiet spell in the tool's output never hides its last lines.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "_BatchedEcho":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._parts.append(text)
+            self._size += len(text)
+            if self._size >= _ECHO_BATCH_SIZE:
+                self._flush_locked()
+        if self._thread is None:
+            # Started on first use, so quiet runs never spawn it
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _flush_locked(self) -> None:
+        if self._parts:
+            click.echo("".join(self._parts), nl=False)
+            self._parts.clear()
+            self._size = 0
+
+    def _run(self) -> None:
+        while not self._stop.wait(_ECHO_BATCH_DELAY):
+            self.flush()
+
+
+# SIGINT handlers of the Vivado calls in progress, innermost last. A single
+# dispatcher is installed by the outermost call; nested calls (e.g. the batch
+# fallback inside run_vivado_tcl_auto) only push their own handler.
+_sigint_handlers: list = []
+
+
+def _dispatch_sigint(signum: int, frame: object) -> None:
+    if _sigint_handlers:
+        _sigint_handlers[-1](signum, frame)
+
+
+@contextmanager
+def _sigint_guard(handler):
+    """Route SIGINT to handler for the duration of the block (nesting-safe)."""
+    outermost = not _sigint_handlers
+    if outermost:
+        old_handler = signal.signal(signal.SIGINT, _dispatch_sigint)
+    _sigint_handlers.append(handler)
+    try:
+        yield
+    finally:
+        _sigint_handlers.pop()
+        if outermost:
+            signal.signal(signal.SIGINT, old_handler)
+
+
 def run_vivado_tcl(
     tcl: str,
     *,
@@ -115,7 +261,7 @@ def run_vivado_tcl(
     quiet: bool = False,
     return_output: bool = False,
 ) -> Union[int, tuple[int, str]]:
-    """Write TCL to a temp file and invoke Vivado batch.
+    """Invoke Vivado batch on a TCL script.
 
     Handles Ctrl+C by terminating the subprocess gracefully.
     Handles SIM_PROGRESS: lines with a fancy updating display.
@@ -124,13 +270,17 @@ def run_vivado_tcl(
         tf.write(tcl)
         tcl_path = Path(tf.name)
 
-    cmd = f'{shlex.quote(vivado)} -mode batch -nolog -nojournal -notrace -source {shlex.quote(str(tcl_path))}'
+    # Without settings Vivado is exec'd directly, with no intermediate /bin/sh
+    argv = [vivado, "-mode", "batch", "-nolog", "-nojournal", "-notrace", "-source", str(tcl_path)]
+    if settings:
+        # Vivado has to run in the environment set up by the settings script
+        cmd = " ".join(shlex.quote(a) for a in argv)
+        argv = ["bash", "-lc", f"source {shlex.quote(str(settings))} && {cmd}"]
 
     # Use Popen for interruptible execution
     proc = None
     interrupted = False
     output_lines: list[str] = []
-    sim_progress_pattern = re.compile(r'^SIM_PROGRESS:(.+)$')
 
     def handle_sigint(signum: int, frame: object) -> None:
         nonlocal interrupted
@@ -140,64 +290,61 @@ def run_vivado_tcl(
             proc.terminate()
 
     try:
-        if settings:
-            full = f"source {shlex.quote(str(settings))} && {cmd}"
-            proc = subprocess.Popen(
-                ["bash", "-lc", full],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-        else:
+        try:
             proc = subprocess.Popen(
-                cmd,
-                shell=True,
+                argv,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
+                bufsize=_PIPE_SIZE,
             )
+        except FileNotFoundError:
+            raise click.ClickException(f"{argv[0]} not found in PATH")
 
-        # Set up SIGINT handler
-        old_handler = signal.signal(signal.SIGINT, handle_sigint)
+        assert proc.stdout is not None
+        _grow_pipe(proc.stdout)
 
-        try:
-            # Read output line by line
-            assert proc.stdout is not None
-            console = Console()
-            live: Optional[Live] = None
-
-            for line in proc.stdout:
-                line_stripped = line.rstrip('\n\r')
-
-                # Check for simulation progress marker
-                match = sim_progress_pattern.match(line_stripped)
-                if match and not quiet:
-                    sim_time = match.group(1).strip()
-                    if live is None:
-                        live = Live(_make_sim_progress_display(sim_time),
-                                   console=console, refresh_per_second=4)
-                        live.start()
-                    else:
-                        live.update(_make_sim_progress_display(sim_time))
-                    # Don't add progress lines to output
-                    continue
+        echo = _BatchedEcho()
 
-                output_lines.append(line)
-                if not quiet:
-                    # Stop live display before printing regular output
-                    if live is not None:
-                        live.stop()
-                        live = None
-                    click.echo(line, nl=False)
-
-            # Clean up live display
-            if live is not None:
-                live.stop()
-
-            proc.wait()
+        try:
+            with _sigint_guard(handle_sigint):
+                # Read output line by line
+                assert proc.stdout is not None
+                console = Console()
+                live: Optional[Live] = None
+
+                for line in proc.stdout:
+                    line_stripped = line.rstrip('\n\r')
+
+                    # Check for simulation progress marker
+                    sim_time = _sim_progress_time(line_stripped)
+                    if sim_time is not None and not quiet:
+                        if live is None:
+                            # Get pending output on screen before the live display
+                            echo.flush()
+                            live = Live(_make_sim_progress_display(sim_time),
+                                       console=console, refresh_per_second=4)
+                            live.start()
+                        else:
+                            live.update(_make_sim_progress_display(sim_time))
+                        # Don't add progress lines to output
+                        continue
+
+                    output_lines.append(line)
+                    if not quiet:
+                        # Stop live display before printing regular output
+                        if live is not None:
+                            live.stop()
+                            live = None
+                        echo.write(line)
+
+                # Clean up live display
+                if live is not None:
+                    live.stop()
+
+                proc.wait()
         finally:
-            # Restore original handler
-            signal.signal(signal.SIGINT, old_handler)
+            echo.close()
 
         output = "".join(output_lines)
         returncode = 130 if interrupted else proc.returncode
@@ -213,6 +360,11 @@ def run_vivado_tcl(
             pass
 
 
+# Project dirs where auto-starting the daemon failed during this process.
+# Later commands go straight to batch mode instead of waiting on another start.
+_daemon_start_failed: set[Path] = set()
+
+
 def run_vivado_tcl_auto(
     tcl: str,
     *,
@@ -304,10 +456,14 @@ def run_vivado_tcl_auto(
                 "Or use --batch to force slow batch mode."
             )
         else:
-            # No GUI, start daemon
+            # No GUI, start daemon (unless it already failed in this process)
+            pd_key = pd.resolve()
+            if pd_key in _daemon_start_failed:
+                return run_vivado_tcl(tcl, settings=settings, quiet=quiet, return_output=return_output)
             if not quiet:
                 click.echo("Starting daemon...", err=True)
             if not start_daemon(proj_dir=pd, settings=settings, quiet=quiet):
+                _daemon_start_failed.add(pd_key)
                 if not quiet:
                     click.echo("Failed to start daemon, using batch mode", err=True)
                 return run_vivado_tcl(tcl, settings=settings, quiet=quiet, return_output=return_output)
@@ -315,10 +471,10 @@ def run_vivado_tcl_auto(
 
     # Use server with interrupt handling and streaming output
     interrupted = False
-    sim_progress_pattern = re.compile(r'^SIM_PROGRESS:(.+)$')
     console = Console()
     live: Optional[Live] = None
     output_lines: list[str] = []
+    echo = _BatchedEcho()
 
     def handle_sigint(signum: int, frame: object) -> None:
         nonlocal interrupted
@@ -330,10 +486,11 @@ def run_vivado_tcl_auto(
     def handle_output(line: str) -> None:
         nonlocal live
         # Check for simulation progress
-        match = sim_progress_pattern.match(line)
-        if match and not quiet:
-            sim_time = match.group(1).strip()
+        sim_time = _sim_progress_time(line)
+        if sim_time is not None and not quiet:
             if live is None:
+                # Get pending output on screen before the live display
+                echo.flush()
                 live = Live(_make_sim_progress_display(sim_time),
                            console=console, refresh_per_second=4)
                 live.start()
@@ -348,12 +505,11 @@ def run_vivado_tcl_auto(
             if live is not None:
                 live.stop()
                 live = None
-            click.echo(line)
-
-    old_handler = signal.signal(signal.SIGINT, handle_sigint)
+            echo.write(line + "\n")
 
     try:
-        result = send_tcl(tcl, proj_dir=pd, output_callback=handle_output)
+        with echo, _sigint_guard(handle_sigint):
+            result = send_tcl(tcl, proj_dir=pd, output_callback=handle_output)
 
         # Clean up live display
         if live is not None:
@@ -388,51 +544,62 @@ def run_vivado_tcl_auto(
             click.echo(f"Server connection error, falling back to batch: {e}", err=True)
         return run_vivado_tcl(tcl, settings=settings, quiet=quiet, return_output=return_output)
     finally:
-        signal.signal(signal.SIGINT, old_handler)
         clear_interrupt_flag(pd)
 
 
-def make_smart_open(xpr: Path) -> str:
-    """
-    Generate TCL to smartly open a project.
-
-    In server mode, checks if project is already open to avoid redundant open_project.
-    Returns TCL that sets ::_vproj_did_open to indicate if we opened the project.
-    """
-    return f"""
+# Smart project open/close TCL; the open template takes the quoted .xpr path
+_SMART_OPEN_TCL = """
 # Smart project open - avoid redundant open/close in server mode
-proc _vproj_ensure_open {{xpr}} {{
-    if {{[llength [get_projects -quiet]] > 0}} {{
+proc _vproj_ensure_open {xpr} {
+    if {[llength [get_projects -quiet]] > 0} {
         # Project already open - check if it's the right one
         set cur_dir [get_property DIRECTORY [current_project]]
         set want_dir [file dirname $xpr]
-        if {{$cur_dir eq $want_dir}} {{
+        if {$cur_dir eq $want_dir} {
             return 0  ;# Already open, nothing to do
-        }}
+        }
         # Different project open - close it first
         close_project
-    }}
+    }
     open_project $xpr
     return 1  ;# We opened it
-}}
+}
 
-set _vproj_proj {tcl_quote(xpr.resolve())}
-if {{![file exists $_vproj_proj]}} {{
+set _vproj_proj %s
+if {![file exists $_vproj_proj]} {
     puts "ERROR: Project not found: $_vproj_proj"
     exit 2
-}}
+}
 set ::_vproj_did_open [_vproj_ensure_open $_vproj_proj]
 
 # Reset any stuck message suppressions first
-catch {{ reset_msg_config -suppress -severity {{WARNING}} }}
-catch {{ reset_msg_config -suppress -severity {{INFO}} }}
-catch {{ reset_msg_config -suppress -severity {{ERROR}} }}
-catch {{ reset_msg_config -suppress -severity {{CRITICAL WARNING}} }}
+catch { reset_msg_config -suppress -severity {WARNING} }
+catch { reset_msg_config -suppress -severity {INFO} }
+catch { reset_msg_config -suppress -severity {ERROR} }
+catch { reset_msg_config -suppress -severity {CRITICAL WARNING} }
 
 # Suppress INFO messages during vproj operations
 set_msg_config -severity INFO -suppress
 """
 
+_SMART_CLOSE_TCL = """
+# Smart project close - only close if we opened it and not in server mode
+reset_msg_config -severity INFO -suppress
+if {$::_vproj_did_open && ![info exists ::vproj_server_mode]} {
+    close_project
+}
+"""
+
+
+def make_smart_open(xpr: Path) -> str:
+    """
+    Generate TCL to smartly open a project.
+
+    In server mode, checks if project is already open to avoid redundant open_project.
+    Returns TCL that sets ::_vproj_did_open to indicate if we opened the project.
+    """
+    return _SMART_OPEN_TCL % tcl_quote(xpr.resolve())
+
 
 def make_smart_close() -> str:
     """
@@ -441,13 +608,30 @@ def make_smart_close() -> str:
     In server mode (::vproj_server_mode set), keeps project open for next command.
     In batch mode, closes the project.
     """
-    return """
-# Smart project close - only close if we opened it and not in server mode
-reset_msg_config -severity INFO -suppress
-if {$::_vproj_did_open && ![info exists ::vproj_server_mode]} {
-    close_project
-}
-"""
+    return _SMART_CLOSE_TCL
+
+
+def _find_newest_xpr(directory: Path) -> tuple[Optional[Path], int]:
+    """Find the newest *.xpr in directory. Returns (newest or None, count).
+
+    One scandir pass, keeping the running newest (ties keep the first seen).
+    """
+    newest: Optional[os.DirEntry[str]] = None
+    newest_mtime = 0.0
+    count = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                # Match glob("*.xpr"), which skips dotfiles
+                if not entry.name.endswith(".xpr") or entry.name.startswith("."):
+                    continue
+                count += 1
+                mtime = entry.stat().st_mtime
+                if newest is None or mtime > newest_mtime:
+                    newest, newest_mtime = entry, mtime
+    except (FileNotFoundError, NotADirectoryError):
+        return None, 0
+    return (directory / newest.name if newest else None), count
 
 
 def find_xpr(hint: Optional[Path], proj_dir: Optional[Path] = None) -> Path:
@@ -465,25 +649,14 @@ def find_xpr(hint: Optional[Path], proj_dir: Optional[Path] = None) -> Path:
     base = Path(".") if hint is None else (hint if hint.is_dir() else hint.parent)
     proj_root = proj_dir or Path(PROJECT_DIR_DEFAULT)
 
-    def find_newest_xpr(directory: Path) -> list[Path]:
-        return sorted(
-            directory.glob("*.xpr"), key=lambda p: p.stat().st_mtime, reverse=True
-        )
-
-    # First, search current directory
-    xprs = find_newest_xpr(base)
-    if xprs:
-        if len(xprs) > 1:
-            click.echo(f"Found multiple .xpr files; using newest: {xprs[0].name}", err=True)
-        return xprs[0].resolve()
-
-    # Then, search project_files/ (or --proj-dir)
+    # First, search current directory, then project_files/ (or --proj-dir)
     search_dir = base / proj_root
-    xprs = find_newest_xpr(search_dir)
-    if xprs:
-        if len(xprs) > 1:
-            click.echo(f"Found multiple .xpr files; using newest: {xprs[0].name}", err=True)
-        return xprs[0].resolve()
+    for directory in (base, search_dir):
+        newest, count = _find_newest_xpr(directory)
+        if newest is not None:
+            if count > 1:
+                click.echo(f"Found multiple .xpr files; using newest: {newest.name}", err=True)
+            return newest.resolve()
 
     raise click.ClickException(
         f"No .xpr found in {base.resolve()} or {search_dir.resolve()}. "
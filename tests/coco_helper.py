@@ -1,22 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps, cache
+import fcntl
 import hashlib
-import os, re, glob
+import json
+import os, re
 from pathlib import Path
 
-from cocotb_tools.runner import get_runner
-import cocotb
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_.-]+")
 
 
 def _slug(s: str) -> str:
-    return re.sub(r"[^A-Za-z0-9_.-]+", "_", s)
+    if s.isascii() and s.isidentifier():
+        return s  # already safe, as test function names are
+    return _SLUG_RE.sub("_", s)
 
 
-_proj_root = (Path(__file__).parent / "..").resolve()
+_here = Path(__file__).parent.resolve()
+_proj_root = _here.parent
+_build_root = _here / ".build"
+_output_root = _here / ".output"
 
 
 @cache
 def _get_vproj_sources() -> tuple[list[str], list[Path]]:
-    """Get source files and include dirs from vproj (requires Vivado server)."""
+    """
+    Get source files and include dirs from vproj.
+
+    The result is also kept in the project's vproj cache, keyed by the .xpr
+    (and this module's) mtime, so later pytest runs skip the Vivado query.
+    """
+    from vproj.cache import read_cache, write_cache
+    from vproj.vivado import find_xpr
+
+    xpr = find_xpr(_proj_root)
+    key = [str(xpr), xpr.stat().st_mtime_ns, Path(__file__).stat().st_mtime_ns]
+    cached = read_cache("coco_sources", xpr.parent)
+    if cached and cached.get("key") == key:
+        return cached["sources"], [Path(d) for d in cached["include_dirs"]]
+
+    sources, include_dirs = _query_vproj_sources()
+    write_cache("coco_sources", {
+        "key": key,
+        "sources": sources,
+        "include_dirs": [str(d) for d in include_dirs],
+    }, xpr.parent)
+    return sources, include_dirs
+
+
+def _query_vproj_sources() -> tuple[list[str], list[Path]]:
+    """Query source files and include dirs from vproj (requires Vivado server)."""
     from vproj.project import list_cmd
 
     files_info = list_cmd(
@@ -32,19 +65,22 @@ def _get_vproj_sources() -> tuple[list[str], list[Path]]:
 
     hdl_types = {"SystemVerilog", "Verilog", "Verilog Header"}
     sources = []
-    include_dirs: set[Path] = set()
+    # dict rather than set: dedupes while keeping a stable order across runs
+    include_dirs: dict[Path, None] = {}
 
     for fileset, path, ftype in files_info:
         if ftype not in hdl_types or fileset != "sources_1":
             continue
-        full_path = (_proj_root / path).resolve()
+        # Paths are already absolute or project-relative; normpath is pure
+        # string work, unlike resolve() which stats every path component
+        full_path = Path(os.path.normpath(_proj_root / path))
         sources.append(str(full_path))
         # Add parent dir of headers as include path
         if ftype == "Verilog Header":
-            include_dirs.add(full_path.parent)
+            include_dirs[full_path.parent] = None
         else:
             # Also add source dirs for `include directives
-            include_dirs.add(full_path.parent)
+            include_dirs[full_path.parent] = None
 
     return sources, list(include_dirs)
 
@@ -59,13 +95,140 @@ def project_includes() -> list[Path]:
     return includes
 
 
+@cache
+def _get_runner():
+    """Verilator runner, created once per process and reused by every test."""
+    # Imported here: the simulator-side import of this module never needs it
+    from cocotb_tools.runner import get_runner
+
+    return get_runner("verilator")
+
+
 def _stable_hash(obj) -> str:
     """
     Deterministic hash() replacement.
-    Returns the first 8 hex characters of the SHA-1 digest of `obj`.
+    Returns an 8 hex character BLAKE2b digest of `obj`, serialized with sorted
+    keys so equal dicts hash the same whatever order they were written in.
     """
-    data = repr(obj).encode("utf-8")
-    return hashlib.sha1(data).hexdigest()[:8]
+    data = json.dumps(obj, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
+
+
+# Build dirs of the models already built or verified by this process, by any
+# runner instance. That's only safe because _run passes hdl_toplevel_lang to
+# runner.test(), which then needs no state from a build() on the same runner.
+_built: set[Path] = set()
+
+
+def _build_fingerprint(top, params, timescale, build_kwargs) -> str:
+    """
+    Fingerprint of everything a Verilator build depends on: the build options
+    plus the path, mtime and size of every project source.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((top, params, timescale, build_kwargs, project_includes())).encode("utf-8"))
+    for src in project_sources():
+        st = os.stat(src)
+        h.update(f"{src}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+# Where the Verilator runner writes its trace (it always names it dump.*)
+_WAVE_CANDIDATES = ("dump.fst", "dump.vcd", "sim_build/dump.fst", "sim_build/dump.vcd")
+
+
+def _find_waveform(test_dir: Path) -> Path:
+    """Find the waveform (VCD/FST) created by a run; test_dir if there is none."""
+    for rel in _WAVE_CANDIDATES:
+        p = test_dir / rel
+        if p.is_file():
+            return p.resolve()
+
+    # Otherwise take any trace, with one listing per directory (.fst preferred)
+    for d in (test_dir, test_dir / "sim_build"):
+        fst = vcd = None
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.name.endswith(".fst"):
+                        fst = e.path
+                        break
+                    if vcd is None and e.name.endswith(".vcd"):
+                        vcd = e.path
+        except FileNotFoundError:
+            continue
+        if fst or vcd:
+            return Path(fst or vcd).resolve()
+    return test_dir
+
+
+def _build_dir(top, params, timescale, build_kwargs) -> Path:
+    return _build_root / _stable_hash((top, params, timescale, build_kwargs))
+
+
+def _ensure_built(runner, top, params, timescale, build_kwargs) -> Path:
+    """Build a model unless it is already up to date; returns its build dir."""
+    build_dir = _build_dir(top, params, timescale, build_kwargs)
+
+    # Tests sharing a model (same top/params/timescale/build_kwargs) build it
+    # once per process; after that the fingerprint check isn't repeated either
+    if build_dir not in _built:
+        build_dir.mkdir(parents=True, exist_ok=True)
+        # Skip the build entirely if nothing it depends on has changed.
+        # Held under a per-build-dir file lock so parallel workers (pytest-xdist)
+        # that need the same model compile it once and share it.
+        fingerprint = _build_fingerprint(top, params, timescale, build_kwargs)
+        fp_file = build_dir / ".vproj_fp"
+        with open(build_dir / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            up_to_date = (
+                (build_dir / top).exists()
+                and fp_file.is_file()
+                and fp_file.read_text() == fingerprint
+            )
+            if not up_to_date:
+                runner.build(
+                    sources=project_sources(),
+                    hdl_toplevel=top,
+                    parameters=params or {},
+                    includes=project_includes(),
+                    build_dir=os.fspath(build_dir),
+                    timescale=timescale,
+                    waves=True,
+                    **build_kwargs or {},
+                )
+                fp_file.write_text(fingerprint)
+        _built.add(build_dir)
+
+    return build_dir
+
+
+# Concurrent prebuilds. Kept small: each build's make already runs -j <ncpu>
+_PREBUILD_WORKERS = 2
+
+
+def prebuild(builds) -> None:
+    """
+    Build several (top, params, timescale, build_kwargs) models in parallel,
+    ahead of the tests that need them. Each build runs Verilator in its own
+    subprocess, so a thread per build is enough to overlap them.
+    """
+    from cocotb_tools.runner import get_runner
+
+    pending = {}
+    for b in builds:
+        d = _build_dir(*b)
+        if d not in _built:
+            pending[d] = b
+    if len(pending) < 2:
+        return  # nothing to overlap; _run builds on demand
+
+    _get_vproj_sources()  # one Vivado query, before fanning out
+    with ThreadPoolExecutor(max_workers=min(len(pending), _PREBUILD_WORKERS)) as ex:
+        # A runner holds per-build state, so each build gets its own
+        futures = [ex.submit(_ensure_built, get_runner("verilator"), *b) for b in pending.values()]
+        for f in futures:
+            f.result()
 
 
 def _run(
@@ -79,47 +242,29 @@ def _run(
 ):
     testcase_module = testcase_fn.__module__
     testcase_name = testcase_fn.__name__  # use the pytest test name
-    build_dir = (
-        (Path(__file__).parent / ".build").resolve()
-        / ".build"
-        / _stable_hash((top, params, build_kwargs))
-    )
-    test_dir = (Path(__file__).parent / ".output" / _slug(testcase_name)).resolve()
-    build_dir.mkdir(parents=True, exist_ok=True)
+    runner = _get_runner()
+    build_dir = _ensure_built(runner, top, params, timescale, build_kwargs)
+    test_dir = _output_root / _slug(testcase_name)
     test_dir.mkdir(parents=True, exist_ok=True)
 
-    runner = get_runner("verilator")
-
-    runner.build(
-        sources=project_sources(),
-        hdl_toplevel=top,
-        parameters=params or {},
-        includes=project_includes(),
-        build_dir=str(build_dir),
-        timescale=timescale,
-        waves=True,
-        **build_kwargs or {},
-    )
-
-    newEnv = os.environ.copy()
-    newEnv["COCOTB_SIM"] = "1"
+    # The runner may never have run build() for this model (fingerprint hit,
+    # or built by prebuild()'s own runner), so state the language explicitly:
+    # otherwise test() derives it from the sources only build() records.
     runner.test(
         hdl_toplevel=top,
+        hdl_toplevel_lang="verilog",
+        build_dir=os.fspath(build_dir),
         test_module=testcase_module,
         testcase=testcase_name,
-        test_dir=str(test_dir),
+        test_dir=os.fspath(test_dir),
         timescale=timescale,
         waves=True,
-        extra_env=newEnv,
+        # the runner merges os.environ in itself, so only the overlay is needed
+        extra_env={"COCOTB_SIM": "1"},
         **run_kwargs or {},
     )
 
-    # find a waveform (VCD/FST) created by this run
-    for pattern in ("*.fst", "*.vcd", "sim_build/*.fst", "sim_build/*.vcd"):
-        found = glob.glob(str(test_dir / pattern))
-        if found:
-            return Path(found[0]).resolve()
-    return test_dir
+    return _find_waveform(test_dir)
 
 
 def coco_test(
@@ -132,6 +277,9 @@ def coco_test(
 ):
     def _decorator(fn: callable):
         if os.getenv("COCOTB_SIM"):
+            # Only the simulator side needs cocotb itself
+            import cocotb
+
             return cocotb.test()(fn)
 
         @wraps(fn)
@@ -146,6 +294,8 @@ def coco_test(
             )
             return None
 
+        # Lets conftest.py prebuild every model the session needs up front
+        _wrapper._coco_build = (top, params, timescale, build_kwargs)
         return _wrapper
 
     return _decorator
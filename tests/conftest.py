@@ -1,6 +1,30 @@
+import os
+import warnings
+
 import pytest
 
+from .coco_helper import prebuild
+
 
 @pytest.fixture()
 def dut():
     return None
+
+
+def pytest_collection_finish(session):
+    """Build the Verilator models of the selected tests in parallel up front."""
+    if session.config.option.collectonly:
+        return
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return  # xdist already runs tests (and their builds) in parallel
+    # session.items holds only the tests left after -k/-m deselection
+    builds = [
+        b
+        for item in session.items
+        if (b := getattr(getattr(item, "obj", None), "_coco_build", None)) is not None
+    ]
+    try:
+        prebuild(builds)
+    except Exception as e:
+        # The tests will rebuild and fail on their own; say why up front
+        warnings.warn(f"Prebuilding Verilator models failed: {e!r}", stacklevel=1)
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from cocotb_tools.runner import get_runner
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer, ClockCycles
+from cocotb.triggers import RisingEdge, Timer
 import cocotb
 from .coco_helper import coco_test
 
@@ -23,12 +23,15 @@ async def test_115200_baud(dut):
     await RisingEdge(dut.clk)
     dut.rst.value = 0
 
-    await ClockCycles(dut.clk, 866, rising=True)
+    # Run to the 866th rising edge: one Timer to half a period before it
+    # (no per-edge Python callbacks), then the edge itself
+    await Timer(865 * 10 + 5, unit="ns")
+    await RisingEdge(dut.clk)
     assert dut.baud_en.value == 0
     await RisingEdge(dut.clk)
     assert dut.baud_en.value == 1
     await RisingEdge(dut.clk)
     #assert dut.baud_en.value == 0
-    await ClockCycles(dut.clk, 32, rising=True)
+    await Timer(32 * 10, unit="ns")
 
 